@@ -4,13 +4,21 @@ Calendar Manager - macOS Calendar integration using EventKit
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Sequence, Union
 import objc
-from Foundation import NSDate, NSTimeZone, NSCalendar, NSDateComponents
+from Foundation import (
+    NSArray, NSDate, NSTimeZone, NSCalendar, NSDateComponents, NSNotificationCenter,
+    NSPredicate, NSCalendarUnitDay, NSObject, NSThread, NSRunLoop, NSDefaultRunLoopMode
+)
 from EventKit import (
     EKEventStore, EKEvent, EKAlarm, EKRecurrenceRule,
-    EKEntityTypeEvent
+    EKEntityTypeEvent, EKEventStoreChangedNotification, EKErrorDomain
 )
 
 # Try to import authorization status constants (may not exist in newer versions)
@@ -28,6 +36,149 @@ except ImportError:
     EKAuthorizationStatusRestricted = 1
     EKAuthorizationStatusNotDetermined = 0
 
+# Prefer a dispatch semaphore for waiting on EventKit completion handlers
+try:
+    from libdispatch import (
+        dispatch_semaphore_create, dispatch_semaphore_signal, dispatch_semaphore_wait,
+        dispatch_time, DISPATCH_TIME_NOW, NSEC_PER_SEC
+    )
+    HAS_LIBDISPATCH = True
+except ImportError:
+    HAS_LIBDISPATCH = False
+
+# Seconds the main run loop is pumped per iteration while waiting on a handler
+_RUN_LOOP_SLICE = 0.05
+
+# Bound once so hot loops skip the PyObjC attribute lookup on every call
+_nsdate_from_timestamp = NSDate.dateWithTimeIntervalSince1970_
+_new_ekevent = EKEvent.eventWithEventStore_
+
+# Unbound EKEvent/NSDate getters, applied with map() so the per-event loops in
+# find_events run in C rather than as Python bytecode
+_get_event_identifier = EKEvent.eventIdentifier
+_get_title = EKEvent.title
+_get_start_date = EKEvent.startDate
+_get_end_date = EKEvent.endDate
+_get_all_day = EKEvent.isAllDay
+_get_location = EKEvent.location
+_get_notes = EKEvent.notes
+_get_calendar = EKEvent.calendar
+_get_timestamp = NSDate.timeIntervalSince1970
+
+# Unbound EKEvent setters, called as _set_x(event, value) when building events
+_set_title = EKEvent.setTitle_
+_set_notes = EKEvent.setNotes_
+_set_location = EKEvent.setLocation_
+_set_calendar = EKEvent.setCalendar_
+_set_all_day = EKEvent.setAllDay_
+_set_start_date = EKEvent.setStartDate_
+_set_end_date = EKEvent.setEndDate_
+_add_alarm = EKEvent.addAlarm_
+
+# Number of events converted per autorelease pool in find_events
+_AUTORELEASE_BATCH_SIZE = 256
+
+# Number of recent find_events queries kept in the result cache
+_FIND_CACHE_SIZE = 16
+
+# Fields returned by find_events, in result order
+EVENT_FIELDS = ('event_id', 'title', 'start_date', 'end_date', 'all_day', 'location', 'notes', 'calendar')
+
+
+def _timestamp_to_iso(timestamp: float) -> str:
+    """Format a Unix timestamp as an ISO 8601 UTC string."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat(timespec='seconds')
+
+
+@dataclass(frozen=True)
+class EventRecord:
+    """An event returned by find_events; fields that were not requested are None."""
+
+    # Declared by hand as dataclass(slots=True) needs Python 3.10
+    __slots__ = EVENT_FIELDS
+
+    event_id: Optional[str]
+    title: Optional[str]
+    start_date: Union[datetime, str, None]
+    end_date: Union[datetime, str, None]
+    all_day: Optional[bool]
+    location: Optional[str]
+    notes: Optional[str]
+    calendar: Optional[str]
+
+    # dataclass(slots=True) would generate these; without them copy and pickle
+    # try to restore the slots through the frozen __setattr__
+    def __getstate__(self):
+        """Get the field values for copying and pickling."""
+        return tuple(getattr(self, field) for field in EVENT_FIELDS)
+
+    def __setstate__(self, state):
+        """Restore the field values saved by __getstate__."""
+        for field, value in zip(EVENT_FIELDS, state):
+            object.__setattr__(self, field, value)
+
+
+class _CompletionSignal:
+    """One-shot signal set from an EventKit completion handler."""
+
+    def __init__(self):
+        self.fired = False
+        if HAS_LIBDISPATCH:
+            self._semaphore = dispatch_semaphore_create(0)
+        else:
+            self._event = threading.Event()
+
+    def set(self):
+        """Mark the completion handler as having run."""
+        self.fired = True
+        if HAS_LIBDISPATCH:
+            dispatch_semaphore_signal(self._semaphore)
+        else:
+            self._event.set()
+
+    def wait(self, timeout: float) -> bool:
+        """Block until set() is called or timeout seconds pass; return whether it fired."""
+        # The handler may already have run synchronously on this thread
+        if self.fired:
+            return True
+
+        if NSThread.isMainThread():
+            # Keep the main run loop turning so a handler delivered on the main
+            # queue can run; blocking the thread outright would deadlock it
+            deadline = NSDate.dateWithTimeIntervalSinceNow_(timeout)
+            run_loop = NSRunLoop.currentRunLoop()
+            while not self.fired and deadline.timeIntervalSinceNow() > 0:
+                slice_end = NSDate.dateWithTimeIntervalSinceNow_(_RUN_LOOP_SLICE)
+                if not run_loop.runMode_beforeDate_(NSDefaultRunLoopMode, slice_end):
+                    # No run loop sources to service; block briefly instead of spinning
+                    self._block(_RUN_LOOP_SLICE)
+            return self.fired
+
+        return self._block(timeout)
+
+    def _block(self, timeout: float) -> bool:
+        """Block the calling thread until set() is called or timeout seconds pass."""
+        if HAS_LIBDISPATCH:
+            deadline = dispatch_time(DISPATCH_TIME_NOW, int(timeout * NSEC_PER_SEC))
+            return dispatch_semaphore_wait(self._semaphore, deadline) == 0
+        return self._event.wait(timeout)
+
+
+class _StoreChangeObserver(NSObject):
+    """Forward EKEventStoreChangedNotification to a CalendarManager without keeping it alive."""
+
+    def initWithManager_(self, manager):
+        self = objc.super(_StoreChangeObserver, self).init()
+        if self is None:
+            return None
+        self._manager_ref = weakref.ref(manager)
+        return self
+
+    def storeChanged_(self, notification):
+        manager = self._manager_ref()
+        if manager is not None:
+            manager._on_store_changed(notification)
+
 
 class CalendarManager:
     """Manage calendar events using macOS EventKit."""
@@ -36,11 +187,48 @@ class CalendarManager:
         """Initialize the calendar manager."""
         self.config = config or {}
         self.logger = logging.getLogger(__name__)
-        self.event_store = EKEventStore.alloc().init()
+
+        # Resolve calendar settings once rather than walking the config per call
+        calendar_config = self.config.get('calendar', {})
+        self._default_calendar_name = calendar_config.get('default_calendar')
+        self._default_length = timedelta(minutes=calendar_config.get('default_duration', 60))
+        self._default_reminder = calendar_config.get('default_reminder')
+        self._search_calendars = calendar_config.get('search_calendars')
+        self._skip_duplicates = calendar_config.get('skip_duplicates', False)
+        self._add_workers = calendar_config.get('add_workers', 1)
+
+        # The store is created on first use, so managers that never touch the
+        # calendar skip the EventKit setup
+        self._event_store = None
+        self._store_observer = None
         self._authorization_status = None
+        self._default_calendar_cache = None
+        self._calendar_by_title = None
+        self._calendars_cache = None
+        self._calendar_colors = {}
+        self._find_cache = OrderedDict()
+
+    @property
+    def event_store(self) -> EKEventStore:
+        """Get the event store, creating it on first use."""
+        if self._event_store is None:
+            self._event_store = EKEventStore.alloc().init()
+
+            # Drop cached calendar lookups whenever the calendar database changes.
+            # The observer only holds a weak reference, so the notification center
+            # never keeps this manager alive.
+            self._store_observer = _StoreChangeObserver.alloc().initWithManager_(self)
+            NSNotificationCenter.defaultCenter().addObserver_selector_name_object_(
+                self._store_observer, b'storeChanged:', EKEventStoreChangedNotification, self._event_store
+            )
+        return self._event_store
 
     def request_calendar_access(self) -> bool:
         """Request access to calendar and return authorization status."""
+        # A grant holds for the life of the process, so never ask twice
+        if self._authorization_status:
+            return True
+
         try:
             # Check if we have the new API (macOS 14+)
             if hasattr(self.event_store, 'requestFullAccessToEventsWithCompletion_'):
@@ -64,11 +252,8 @@ class CalendarManager:
 
     def _request_access_new_api(self) -> bool:
         """Request access using the new API (macOS 14+)."""
-        import threading
-        import time
-
         result = [None]
-        event = threading.Event()
+        event = _CompletionSignal()
 
         def completion_handler(granted, error):
             result[0] = granted and not error
@@ -126,11 +311,8 @@ class CalendarManager:
 
     def _request_access_sync(self) -> bool:
         """Request calendar access synchronously using intermediate API."""
-        import threading
-        import time
-
         result = [None]  # Use list to make it mutable in closure
-        event = threading.Event()
+        event = _CompletionSignal()
 
         def completion_handler(granted, error):
             result[0] = granted and not error
@@ -182,7 +364,7 @@ class CalendarManager:
             return []
 
         try:
-            calendars = self.event_store.calendarsForEntityType_(EKEntityTypeEvent)
+            calendars = self._get_event_calendars()
             calendar_list = []
 
             for calendar in calendars:
@@ -202,7 +384,15 @@ class CalendarManager:
             return []
 
     def _get_calendar_color(self, calendar) -> str:
-        """Get calendar color as hex string."""
+        """Get calendar color as hex string, memoized per calendar identifier."""
+        identifier = str(calendar.calendarIdentifier())
+        color = self._calendar_colors.get(identifier)
+        if color is None:
+            color = self._calendar_colors[identifier] = self._read_calendar_color(calendar)
+        return color
+
+    def _read_calendar_color(self, calendar) -> str:
+        """Read calendar color from EventKit as hex string."""
         try:
             if hasattr(calendar, 'color') and calendar.color():
                 # Convert NSColor to hex
@@ -221,100 +411,272 @@ class CalendarManager:
         if not self._check_authorization():
             return None
 
+        return self._get_default_calendar_unchecked()
+
+    def _get_default_calendar_unchecked(self):
+        """Resolve the default calendar, assuming calendar access is authorized."""
+        if self._default_calendar_cache is not None:
+            return self._default_calendar_cache
+
         try:
+            calendar = None
+
             # Try to get calendar by name from config
-            calendar_name = self.config.get('calendar', {}).get('default_calendar')
-            if calendar_name:
-                calendars = self.event_store.calendarsForEntityType_(EKEntityTypeEvent)
-                for calendar in calendars:
-                    if calendar.title() == calendar_name and calendar.allowsContentModifications():
-                        return calendar
+            if self._default_calendar_name:
+                calendar = self._get_calendars_by_title().get(self._default_calendar_name)
 
             # Fall back to default calendar
-            return self.event_store.defaultCalendarForNewEvents()
+            if calendar is None:
+                calendar = self.event_store.defaultCalendarForNewEvents()
+
+            self._default_calendar_cache = calendar
+            return calendar
 
         except Exception as e:
             self.logger.error(f"Error getting default calendar: {e}")
             return None
 
-    def add_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Add multiple events to calendar."""
+    def _get_event_calendars(self):
+        """Get the NSArray of event calendars, fetched once and cached."""
+        if self._calendars_cache is None:
+            self._calendars_cache = self.event_store.calendarsForEntityType_(EKEntityTypeEvent)
+        return self._calendars_cache
+
+    def _get_calendars_by_title(self) -> Dict[str, Any]:
+        """Get writable calendars keyed by title, built once and cached."""
+        if self._calendar_by_title is None:
+            calendars_by_title = {}
+            for calendar in self._get_event_calendars():
+                if calendar.allowsContentModifications():
+                    # Keep the first calendar when several share a title
+                    calendars_by_title.setdefault(str(calendar.title()), calendar)
+            self._calendar_by_title = calendars_by_title
+        return self._calendar_by_title
+
+    def reset_calendar_cache(self):
+        """Forget cached calendar lookups so they are resolved again on next use."""
+        self._default_calendar_cache = None
+        self._calendar_by_title = None
+        self._calendars_cache = None
+        self._calendar_colors = {}
+        self._find_cache.clear()
+
+    def _on_store_changed(self, notification):
+        """Handle EKEventStoreChangedNotification by clearing calendar caches."""
+        self.logger.debug("Event store changed, clearing calendar caches")
+        self.reset_calendar_cache()
+
+    def close(self):
+        """Stop observing event store changes."""
+        if self._store_observer is not None:
+            NSNotificationCenter.defaultCenter().removeObserver_(self._store_observer)
+            self._store_observer = None
+
+    def add_events(self, events: List[Dict[str, Any]],
+                   skip_duplicates: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """Add multiple events to calendar, committing them in a single batch."""
+        if self._add_workers > 1 and len(events) > 1:
+            return self.add_events_parallel(events, self._add_workers, skip_duplicates)
+
         if not self._check_authorization():
             return []
 
+        calendar = self._get_default_calendar_unchecked()
+        if not calendar:
+            return [{'success': False, 'error': 'No suitable calendar found'} for _ in events]
+
+        calendar_title = str(calendar.title())
+
+        results, to_save = self._skip_duplicate_events(events, calendar, skip_duplicates)
+
+        for index, result in self._save_events(self.event_store, to_save, calendar, calendar_title):
+            results[index] = result
+
+        added = sum(1 for result in results if result['success'])
+        self.logger.info(f"Added {added} of {len(events)} events to calendar '{calendar_title}'")
+        return results
+
+    def _skip_duplicate_events(self, events: List[Dict[str, Any]], calendar,
+                               skip_duplicates: Optional[bool]) -> tuple:
+        """Get a results list with duplicates filled in, and the (index, event data) pairs left to save."""
+        if skip_duplicates is None:
+            skip_duplicates = self._skip_duplicates
+        existing_keys = self._find_existing_event_keys(events, calendar) if skip_duplicates else set()
+
+        results = [None] * len(events)
+        to_save = []
+        for index, event_data in enumerate(events):
+            if existing_keys and self._duplicate_key(event_data) in existing_keys:
+                self.logger.info(f"Skipping duplicate event: {event_data.get('title')}")
+                results[index] = {'success': False, 'duplicate': True, 'error': 'Event already exists in calendar'}
+            else:
+                to_save.append((index, event_data))
+        return results, to_save
+
+    def _save_events(self, store, indexed_events: List[tuple], calendar,
+                     calendar_title: str) -> List[tuple]:
+        """Save (index, event data) pairs to a store in one commit, returning (index, result) pairs."""
+        default_length = self._default_length
+        reminder_minutes = self._default_reminder
+        ns_calendar = NSCalendar.currentCalendar()
+
         results = []
-        for event_data in events:
-            result = self.add_event(event_data)
-            results.append(result)
+        pending = []
+        for index, event_data in indexed_events:
+            try:
+                event = self._build_event(store, event_data, calendar, default_length, reminder_minutes, ns_calendar)
+                # Save without committing; everything is written by one commit below
+                success, error = self._save_event(store, event, commit=False)
+            except Exception as e:
+                error_msg = f"Error adding event: {e}"
+                self.logger.error(error_msg)
+                results.append((index, {'success': False, 'error': error_msg}))
+                continue
+
+            if success:
+                pending.append((index, event, event_data))
+            else:
+                error_msg = self._describe_error(error)
+                self.logger.error(f"Failed to save event: {error_msg}")
+                results.append((index, {'success': False, 'error': f'Failed to save event: {error_msg}'}))
+
+        if pending:
+            committed, error = store.commit_(None)
+            if committed:
+                self._find_cache.clear()
+                log_each = self.logger.isEnabledFor(logging.DEBUG)
+                for index, event, event_data in pending:
+                    event_id = str(event.eventIdentifier())
+                    if log_each:
+                        self.logger.debug(f"Added event: {event_data.get('title')} (ID: {event_id})")
+                    results.append((index, {
+                        'success': True,
+                        'event_id': event_id,
+                        'title': event_data.get('title'),
+                        'calendar': calendar_title
+                    }))
+            else:
+                # Discard the uncommitted saves so the store stays consistent
+                store.reset()
+                error_msg = self._describe_error(error)
+                self.logger.error(f"Failed to commit events: {error_msg}")
+                for index, _, _ in pending:
+                    results.append((index, {'success': False, 'error': f'Failed to commit events: {error_msg}'}))
 
         return results
 
-    def add_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Add a single event to calendar."""
+    def add_events_parallel(self, events: List[Dict[str, Any]], max_workers: int = 4,
+                            skip_duplicates: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """Add multiple events by saving equal slices of the batch concurrently."""
         if not self._check_authorization():
-            return {'success': False, 'error': 'Calendar access not authorized'}
+            return []
 
-        try:
-            # Get the calendar to add to
-            calendar = self.get_default_calendar()
-            if not calendar:
-                return {'success': False, 'error': 'No suitable calendar found'}
+        calendar = self._get_default_calendar_unchecked()
+        if not calendar:
+            return [{'success': False, 'error': 'No suitable calendar found'} for _ in events]
 
-            # Create the event
-            event = EKEvent.eventWithEventStore_(self.event_store)
+        calendar_title = str(calendar.title())
 
-            # Set basic properties
-            event.setTitle_(event_data.get('title', 'Untitled Event'))
+        results, to_save = self._skip_duplicate_events(events, calendar, skip_duplicates)
 
-            description = event_data.get('description', '')
-            if description:
-                event.setNotes_(description)
+        if to_save:
+            # Calendars belong to a store, so workers re-resolve it by identifier
+            calendar_id = str(calendar.calendarIdentifier())
+            workers = max(1, min(max_workers, len(to_save)))
+            slices = [to_save[i::workers] for i in range(workers)]
 
-            location = event_data.get('location')
-            if location:
-                event.setLocation_(location)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(self._add_events_in_new_store, indexed_events, calendar_id, calendar_title)
+                    for indexed_events in slices
+                ]
+                for future in futures:
+                    for index, result in future.result():
+                        results[index] = result
+
+        added = sum(1 for result in results if result['success'])
+        self.logger.info(f"Added {added} of {len(events)} events to calendar '{calendar_title}'")
+        return results
+
+    def _add_events_in_new_store(self, indexed_events: List[tuple], calendar_id: str,
+                                 calendar_title: str) -> List[tuple]:
+        """Save a slice of a batch using a private EKEventStore, as stores are not thread-safe."""
+        # Worker threads have no autorelease pool of their own
+        with objc.autorelease_pool():
+            try:
+                store = EKEventStore.alloc().init()
+                calendar = store.calendarWithIdentifier_(calendar_id)
+                if calendar is None:
+                    raise RuntimeError(f"calendar '{calendar_title}' is not available")
+                return self._save_events(store, indexed_events, calendar, calendar_title)
+            except Exception as e:
+                error_msg = f"Error adding event: {e}"
+                self.logger.error(error_msg)
+                return [(index, {'success': False, 'error': error_msg}) for index, _ in indexed_events]
+
+    def _find_existing_event_keys(self, events: List[Dict[str, Any]], calendar) -> set:
+        """Get duplicate-check keys for calendar events starting within the span of a batch."""
+        timestamps = [self._duplicate_start(event_data) for event_data in events]
+        timestamps = [timestamp for timestamp in timestamps if timestamp is not None]
+        if not timestamps:
+            return set()
+
+        # One query covering the whole batch instead of one lookup per new event,
+        # on the target calendar itself since several accounts may share a title.
+        # Start dates come back as UTC ISO strings, which skips a local time
+        # zone conversion per existing event.
+        try:
+            existing = self._query_events(
+                min(timestamps), max(timestamps) + 1, NSArray.arrayWithObject_(calendar),
+                None, None, ('title', 'start_date'), iso_dates=True
+            )
+        except Exception as e:
+            self.logger.error(f"Error finding existing events: {e}")
+            return set()
+        return {(event_info.title, event_info.start_date) for event_info in existing}
+
+    def _duplicate_key(self, event_data: Dict[str, Any]):
+        """Get the (title, UTC start) key used to spot an event already in the calendar."""
+        timestamp = self._duplicate_start(event_data)
+        if timestamp is None:
+            return None
+        return (event_data.get('title', 'Untitled Event'), _timestamp_to_iso(timestamp))
 
-            # Set calendar
-            event.setCalendar_(calendar)
+    def _duplicate_start(self, event_data: Dict[str, Any]) -> Optional[float]:
+        """Get the start timestamp an event will be saved with, or None if it has no start."""
+        start = event_data.get('start_time')
+        if not start:
+            return None
+        if event_data.get('all_day', False):
+            # All-day events are stored from the start of the day
+            start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        return start.timestamp()
 
-            # Handle all-day events
-            if event_data.get('all_day', False):
-                event.setAllDay_(True)
-                # For all-day events, use date components
-                start_date = event_data['start_time']
-                event.setStartDate_(self._datetime_to_nsdate(start_date))
+    def add_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a single event to calendar."""
+        if not self._check_authorization():
+            return {'success': False, 'error': 'Calendar access not authorized'}
 
-                if event_data.get('end_time'):
-                    end_date = event_data['end_time']
-                    event.setEndDate_(self._datetime_to_nsdate(end_date))
-                else:
-                    # All-day event defaults to same day
-                    event.setEndDate_(self._datetime_to_nsdate(start_date + timedelta(days=1)))
-            else:
-                # Regular timed event
-                start_time = event_data['start_time']
-                event.setStartDate_(self._datetime_to_nsdate(start_time))
+        return self._add_event_unchecked(event_data)
 
-                if event_data.get('end_time'):
-                    end_time = event_data['end_time']
-                    event.setEndDate_(self._datetime_to_nsdate(end_time))
-                else:
-                    # Default duration
-                    duration = self.config.get('calendar', {}).get('default_duration', 60)
-                    end_time = start_time + timedelta(minutes=duration)
-                    event.setEndDate_(self._datetime_to_nsdate(end_time))
+    def _add_event_unchecked(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a single event, assuming calendar access is authorized."""
+        try:
+            # Get the calendar to add to
+            calendar = self._get_default_calendar_unchecked()
+            if not calendar:
+                return {'success': False, 'error': 'No suitable calendar found'}
 
-            # Add reminder if configured
-            reminder_minutes = self.config.get('calendar', {}).get('default_reminder')
-            if reminder_minutes:
-                alarm = EKAlarm.alarmWithRelativeOffset_(-reminder_minutes * 60)  # negative for before
-                event.addAlarm_(alarm)
+            event = self._build_event(
+                self.event_store, event_data, calendar, self._default_length, self._default_reminder,
+                NSCalendar.currentCalendar()
+            )
 
             # Save the event
-            error = objc.nil
-            success = self.event_store.saveEvent_span_error_(event, 0, objc.nil)  # 0 = this event only
+            success, error = self._save_event(self.event_store, event, commit=True)
 
             if success:
+                self._find_cache.clear()
                 event_id = str(event.eventIdentifier())
                 self.logger.info(f"Successfully added event: {event_data.get('title')} (ID: {event_id})")
                 return {
@@ -324,7 +686,7 @@ class CalendarManager:
                     'calendar': str(calendar.title())
                 }
             else:
-                error_msg = str(error) if error else "Unknown error"
+                error_msg = self._describe_error(error)
                 self.logger.error(f"Failed to save event: {error_msg}")
                 return {'success': False, 'error': f'Failed to save event: {error_msg}'}
 
@@ -333,11 +695,79 @@ class CalendarManager:
             self.logger.error(error_msg)
             return {'success': False, 'error': error_msg}
 
-    def _datetime_to_nsdate(self, dt: datetime) -> NSDate:
-        """Convert Python datetime to NSDate."""
-        # Convert to timestamp and create NSDate
-        timestamp = dt.timestamp()
-        return NSDate.dateWithTimeIntervalSince1970_(timestamp)
+    def _save_event(self, store, event, commit: bool):
+        """Save an event for this occurrence only, retrying once on a transient error."""
+        # PyObjC returns the NSError out-parameter alongside the result
+        success, error = store.saveEvent_span_commit_error_(event, 0, commit, None)
+        if not success and self._is_transient_error(error):
+            self.logger.debug(f"Retrying event save after transient error: {self._describe_error(error)}")
+            success, error = store.saveEvent_span_commit_error_(event, 0, commit, None)
+        return success, error
+
+    def _is_transient_error(self, error) -> bool:
+        """Check whether a failed store operation may succeed if retried."""
+        # EKErrorDomain codes are validation failures (read-only calendar,
+        # missing dates, ...) that a retry cannot fix
+        return error is not None and error.domain() != EKErrorDomain
+
+    def _describe_error(self, error) -> str:
+        """Get a readable message from an NSError."""
+        return str(error.localizedDescription()) if error else "Unknown error"
+
+    def _build_event(self, store, event_data: Dict[str, Any], calendar, default_length: timedelta,
+                     reminder_minutes: Optional[int], ns_calendar) -> EKEvent:
+        """Create an unsaved EKEvent in a store from extracted event data."""
+        event = _new_ekevent(store)
+
+        # Set basic properties
+        _set_title(event, event_data.get('title', 'Untitled Event'))
+
+        description = event_data.get('description', '')
+        if description:
+            _set_notes(event, description)
+
+        location = event_data.get('location')
+        if location:
+            _set_location(event, location)
+
+        # Set calendar
+        _set_calendar(event, calendar)
+
+        # Handle all-day events
+        if event_data.get('all_day', False):
+            _set_all_day(event, True)
+            # For all-day events, anchor to the start of the local calendar day
+            start_date = ns_calendar.startOfDayForDate_(
+                _nsdate_from_timestamp(event_data['start_time'].timestamp())
+            )
+            _set_start_date(event, start_date)
+
+            if event_data.get('end_time'):
+                end_date = event_data['end_time']
+                _set_end_date(event, _nsdate_from_timestamp(end_date.timestamp()))
+            else:
+                # All-day event defaults to same day
+                _set_end_date(event, ns_calendar.dateByAddingUnit_value_toDate_options_(
+                    NSCalendarUnitDay, 1, start_date, 0
+                ))
+        else:
+            # Regular timed event
+            start_time = event_data['start_time']
+            _set_start_date(event, _nsdate_from_timestamp(start_time.timestamp()))
+
+            if event_data.get('end_time'):
+                end_time = event_data['end_time']
+                _set_end_date(event, _nsdate_from_timestamp(end_time.timestamp()))
+            else:
+                # Default duration
+                _set_end_date(event, _nsdate_from_timestamp((start_time + default_length).timestamp()))
+
+        # Add reminder if configured
+        if reminder_minutes:
+            alarm = EKAlarm.alarmWithRelativeOffset_(-reminder_minutes * 60)  # negative for before
+            _add_alarm(event, alarm)
+
+        return event
 
     def _check_authorization(self) -> bool:
         """Check if calendar access is authorized."""
@@ -345,52 +775,249 @@ class CalendarManager:
             return self.request_calendar_access()
         return self._authorization_status
 
-    def find_events(self, start_date: datetime, end_date: datetime, title_filter: str = None) -> List[Dict[str, Any]]:
-        """Find events in the specified date range."""
+    def find_events(self, start_date: datetime, end_date: datetime, title_filter: str = None,
+                    calendar_names: Optional[List[str]] = None,
+                    max_results: Optional[int] = None,
+                    fields: Sequence[str] = EVENT_FIELDS,
+                    iso_dates: bool = False) -> List[EventRecord]:
+        """Find events in the specified date range, optionally limited to named calendars."""
+        unknown_fields = set(fields) - set(EVENT_FIELDS)
+        if unknown_fields:
+            raise ValueError(f"Unknown event fields: {', '.join(sorted(unknown_fields))}")
+
         if not self._check_authorization():
             return []
 
+        return self._find_events_unchecked(start_date, end_date, title_filter, calendar_names, max_results,
+                                           tuple(fields), iso_dates)
+
+    def _find_events_unchecked(self, start_date: datetime, end_date: datetime, title_filter: Optional[str],
+                               calendar_names: Optional[List[str]], max_results: Optional[int],
+                               fields: Sequence[str] = EVENT_FIELDS,
+                               iso_dates: bool = False) -> List[EventRecord]:
+        """Find events, assuming calendar access is authorized."""
+        # Fall back to the configured search calendars; empty means search all
+        if calendar_names is None:
+            calendar_names = self._search_calendars
+
+        # Repeated queries are answered from the cache until the store changes
+        start_timestamp = start_date.timestamp()
+        end_timestamp = end_date.timestamp()
+        cache_key = (start_timestamp, end_timestamp, title_filter,
+                     tuple(sorted(calendar_names or ())), max_results, tuple(fields), iso_dates)
+        event_list = self._find_cache.get(cache_key)
+        if event_list is not None:
+            self._find_cache.move_to_end(cache_key)
+            return list(event_list)
+
         try:
-            # Create date predicate
-            start_ns = self._datetime_to_nsdate(start_date)
-            end_ns = self._datetime_to_nsdate(end_date)
+            if calendar_names:
+                calendars = self._resolve_calendars(calendar_names)
+                if calendars is None:
+                    return []
+            else:
+                calendars = self._get_event_calendars()
 
-            calendars = self.event_store.calendarsForEntityType_(EKEntityTypeEvent)
-            predicate = self.event_store.predicateForEventsWithStartDate_endDate_calendars_(
-                start_ns, end_ns, calendars
-            )
+            event_list = self._query_events(start_timestamp, end_timestamp, calendars, title_filter,
+                                            max_results, fields, iso_dates)
 
-            # Fetch events
-            events = self.event_store.eventsMatchingPredicate_(predicate)
-
-            event_list = []
-            for event in events:
-                # Apply title filter if specified
-                if title_filter and title_filter.lower() not in event.title().lower():
-                    continue
-
-                event_info = {
-                    'event_id': str(event.eventIdentifier()),
-                    'title': str(event.title()),
-                    'start_date': self._nsdate_to_datetime(event.startDate()),
-                    'end_date': self._nsdate_to_datetime(event.endDate()),
-                    'all_day': event.isAllDay(),
-                    'location': str(event.location()) if event.location() else None,
-                    'notes': str(event.notes()) if event.notes() else None,
-                    'calendar': str(event.calendar().title())
-                }
-                event_list.append(event_info)
+        except Exception as e:
+            self.logger.error(f"Error finding events: {e}")
+            return []
+
+        self._find_cache[cache_key] = event_list
+        if len(self._find_cache) > _FIND_CACHE_SIZE:
+            self._find_cache.popitem(last=False)
+
+        # Records are immutable, so only the list itself needs copying
+        return list(event_list)
+
+    def _query_events(self, start_timestamp: float, end_timestamp: float, calendars,
+                      title_filter: Optional[str], max_results: Optional[int],
+                      fields: Sequence[str] = EVENT_FIELDS, iso_dates: bool = False) -> List[EventRecord]:
+        """Search an NSArray of calendars (nil for all) in the shared store, bypassing the result cache."""
+        # Create date predicate
+        predicate = self.event_store.predicateForEventsWithStartDate_endDate_calendars_(
+            _nsdate_from_timestamp(start_timestamp), _nsdate_from_timestamp(end_timestamp), calendars
+        )
+
+        events = self._collect_events(self.event_store, predicate, title_filter, max_results)
+        return self._build_event_records(events, fields, iso_dates)
+
+    def find_events_parallel(self, start_date: datetime, end_date: datetime, title_filter: str = None,
+                             calendar_names: Optional[List[str]] = None,
+                             chunks: int = 12) -> List[EventRecord]:
+        """Find events by searching equal sub-ranges of the date range concurrently."""
+        if not self._check_authorization():
+            return []
 
-            return event_list
+        try:
+            if calendar_names is None:
+                calendar_names = self._search_calendars
+
+            # Calendars belong to a store, so workers re-resolve them by identifier
+            calendar_ids = None
+            if calendar_names:
+                calendars = self._resolve_calendars(calendar_names)
+                if calendars is None:
+                    return []
+                calendar_ids = [str(calendar.calendarIdentifier()) for calendar in calendars]
+
+            step = (end_date - start_date) / chunks
+            bounds = [start_date + step * i for i in range(chunks)] + [end_date]
+
+            with ThreadPoolExecutor(max_workers=chunks) as pool:
+                futures = [
+                    pool.submit(self._find_events_in_new_store,
+                                bounds[i], bounds[i + 1], title_filter, calendar_ids)
+                    for i in range(chunks)
+                ]
+                chunk_results = [future.result() for future in futures]
+
+            # Events spanning a sub-range boundary are returned by both neighbours;
+            # occurrences of a recurring event share an ID, so key on start date too
+            merged = {}
+            for event_list in chunk_results:
+                for event_info in event_list:
+                    merged.setdefault((event_info.event_id, event_info.start_date), event_info)
+
+            return sorted(merged.values(), key=lambda event_info: event_info.start_date)
 
         except Exception as e:
-            self.logger.error(f"Error finding events: {e}")
+            self.logger.error(f"Error finding events in parallel: {e}")
             return []
 
-    def _nsdate_to_datetime(self, nsdate: NSDate) -> datetime:
-        """Convert NSDate to Python datetime."""
-        timestamp = nsdate.timeIntervalSince1970()
-        return datetime.fromtimestamp(timestamp)
+    def _find_events_in_new_store(self, start_date: datetime, end_date: datetime, title_filter: Optional[str],
+                                  calendar_ids: Optional[List[str]]) -> List[EventRecord]:
+        """Search one date range using a private EKEventStore, as stores are not thread-safe."""
+        # Worker threads have no autorelease pool of their own
+        with objc.autorelease_pool():
+            store = EKEventStore.alloc().init()
+
+            calendars = None  # nil searches every calendar
+            if calendar_ids is not None:
+                calendars = NSArray.arrayWithArray_([
+                    calendar for calendar in map(store.calendarWithIdentifier_, calendar_ids)
+                    if calendar is not None
+                ])
+
+            predicate = store.predicateForEventsWithStartDate_endDate_calendars_(
+                _nsdate_from_timestamp(start_date.timestamp()),
+                _nsdate_from_timestamp(end_date.timestamp()),
+                calendars
+            )
+
+            events = self._collect_events(store, predicate, title_filter)
+            return self._build_event_records(events)
+
+    def _collect_events(self, store, predicate, title_filter: Optional[str] = None,
+                        max_results: Optional[int] = None) -> list:
+        """Collect the EKEvents matching a predicate whose titles contain title_filter."""
+        # The block appends before checking the limit, so a limit of zero
+        # must not start the enumeration at all
+        if max_results is not None and max_results <= 0:
+            return []
+
+        # Stream matches rather than materializing the full result array,
+        # so only the events we keep stay alive
+        events = []
+        append = events.append
+        limit = max_results if max_results is not None else float('inf')
+
+        # The return value of the block is written to the stop out-parameter.
+        # Loop invariants are resolved up front so each call does the minimum.
+        if title_filter:
+            # EventKit only accepts its own date predicates, so the title
+            # filter is evaluated natively against each streamed event
+            matches_title = NSPredicate.predicateWithFormat_(
+                "title CONTAINS[cd] %@", title_filter
+            ).evaluateWithObject_
+
+            def collect(event, stop):
+                if event is not None and matches_title(event):
+                    append(event)
+                return len(events) >= limit
+        else:
+            def collect(event, stop):
+                if event is not None:
+                    append(event)
+                return len(events) >= limit
+
+        with objc.autorelease_pool():
+            store.enumerateEventsMatchingPredicate_usingBlock_(predicate, collect)
+        return events
+
+    def _build_event_records(self, events: list, fields: Sequence[str] = EVENT_FIELDS,
+                             iso_dates: bool = False) -> List[EventRecord]:
+        """Convert EKEvents into EventRecords holding only the requested fields."""
+        # Many events share a calendar, so fetch each calendar title only once
+        calendar_titles = {}
+
+        event_list = []
+        # Drain the autoreleased NSStrings/NSDates the getters create every
+        # batch, rather than letting them pile up until the caller's pool drains
+        for offset in range(0, len(events), _AUTORELEASE_BATCH_SIZE):
+            batch = events[offset:offset + _AUTORELEASE_BATCH_SIZE]
+            with objc.autorelease_pool():
+                # Read field by field so only the requested getters are called
+                unrequested = [None] * len(batch)
+                columns = [
+                    self._read_event_column(field, batch, calendar_titles, iso_dates)
+                    if field in fields else unrequested
+                    for field in EVENT_FIELDS
+                ]
+                event_list.extend(map(EventRecord, *columns))
+
+        return event_list
+
+    def _read_event_column(self, field: str, events: list, calendar_titles: Dict[Any, Any],
+                           iso_dates: bool = False) -> list:
+        """Read one result field for every event in a batch."""
+        # Dates become local datetimes, or UTC ISO strings ready for JSON output
+        convert_timestamp = _timestamp_to_iso if iso_dates else datetime.fromtimestamp
+
+        # PyObjC already bridges NSString to a str subclass, so no str() copies
+        if field == 'event_id':
+            return list(map(_get_event_identifier, events))
+        if field == 'title':
+            return list(map(_get_title, events))
+        if field == 'start_date':
+            return list(map(convert_timestamp, map(_get_timestamp, map(_get_start_date, events))))
+        if field == 'end_date':
+            return list(map(convert_timestamp, map(_get_timestamp, map(_get_end_date, events))))
+        if field == 'all_day':
+            return list(map(_get_all_day, events))
+        if field == 'location':
+            return [location or None for location in map(_get_location, events)]
+        if field == 'notes':
+            return [notes or None for notes in map(_get_notes, events)]
+        if field == 'calendar':
+            titles = []
+            for calendar in map(_get_calendar, events):
+                calendar_id = calendar.calendarIdentifier()
+                calendar_title = calendar_titles.get(calendar_id)
+                if calendar_title is None:
+                    calendar_title = calendar_titles[calendar_id] = calendar.title()
+                titles.append(calendar_title)
+            return titles
+        raise ValueError(f"Unknown event field: {field}")
+
+    def _resolve_calendars(self, calendar_names: List[str]):
+        """Resolve calendar titles to an NSArray of calendars, or None if none match."""
+        calendars_by_title = self._get_calendars_by_title()
+        calendars = []
+        for name in calendar_names:
+            calendar = calendars_by_title.get(name)
+            if calendar is None:
+                self.logger.warning(f"Calendar not found or read-only: {name}")
+            else:
+                calendars.append(calendar)
+
+        if not calendars:
+            self.logger.warning("None of the requested calendars are available to search")
+            return None
+
+        return NSArray.arrayWithArray_(calendars)
 
     def delete_event(self, event_id: str) -> bool:
         """Delete an event by ID."""
@@ -403,12 +1030,16 @@ class CalendarManager:
                 self.logger.warning(f"Event with ID {event_id} not found")
                 return False
 
-            success = self.event_store.removeEvent_span_error_(event, 0, objc.nil)
+            success, error = self.event_store.removeEvent_span_error_(event, 0, None)
+            if not success and self._is_transient_error(error):
+                success, error = self.event_store.removeEvent_span_error_(event, 0, None)
+
             if success:
+                self._find_cache.clear()
                 self.logger.info(f"Successfully deleted event: {event_id}")
                 return True
             else:
-                self.logger.error(f"Failed to delete event: {event_id}")
+                self.logger.error(f"Failed to delete event {event_id}: {self._describe_error(error)}")
                 return False
 
         except Exception as e:
@@ -4,75 +4,173 @@ Event Extractor - Extract calendar events from text using LLM
 """
 
 import json
-import re
+import functools
+import importlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
-import dateparser
+from typing import List, Dict, Optional, Any, Iterable, Iterator
 from dateutil import tz
 import yaml
 import logging
 
-# LLM clients
+# Faster JSON decoding when orjson is installed
 try:
-    import openai
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    openai = None
+    _json_loads = json.loads
+
+_JSON_DECODER = json.JSONDecoder()
+
+# libyaml's C parser when PyYAML was built with it; both only build plain objects
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Concurrent LLM requests used when a batched extraction has to fall back
+_MAX_EXTRACTION_WORKERS = 4
+
+
+def load_config(config_path: str) -> Dict[str, Any]:
+    """Load configuration from YAML file."""
+    try:
+        with open(config_path, 'r') as f:
+            return yaml.load(f, Loader=_YAML_LOADER)
+    except FileNotFoundError:
+        logging.warning(f"Config file {config_path} not found. Using defaults.")
+        return _get_default_config()
+    except yaml.YAMLError as e:
+        logging.error(f"Error parsing config file: {e}")
+        return _get_default_config()
+
+
+def _get_default_config() -> Dict[str, Any]:
+    """Get default configuration."""
+    return {
+        'llm': {
+            'provider': 'openai',
+            'openai_model': 'gpt-4',
+            'anthropic_model': 'claude-3-sonnet-20240229',
+            'temperature': 0.1,
+            'max_tokens': 1000
+        },
+        'calendar': {
+            'default_duration': 60,
+            'default_reminder': 15
+        },
+        'text': {
+            'min_length': 10,
+            'max_length': 5000
+        },
+        'logging': {
+            'level': 'INFO'
+        }
+    }
 
-try:
-    import anthropic
-except ImportError:
-    anthropic = None
 
-try:
-    import requests
-except ImportError:
-    requests = None
+def _import_llm_sdk(name: str):
+    """Import an LLM client library on first use, returning None if it isn't installed."""
+    # The SDKs are slow to import, so only the configured one is ever loaded
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_dt_cached(dt_str: str) -> Optional[datetime]:
+    """Parse datetime string into datetime object, memoized per string."""
+    # The prompt asks for ISO timestamps, so try that first and only fall
+    # back to the (much slower) dateparser when it doesn't parse
+    try:
+        return datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
+    except ValueError:
+        pass
+
+    import dateparser
+
+    # Use dateparser for flexible parsing
+    parsed = dateparser.parse(dt_str)
+    if parsed:
+        # If no timezone info, assume local timezone
+        if parsed.tzinfo is None:
+            local_tz = tz.tzlocal()
+            parsed = parsed.replace(tzinfo=local_tz)
+        return parsed
+
+    return None
 
 
 class EventExtractor:
     """Extract calendar events from text using various LLM providers."""
 
-    def __init__(self, config_path: str = "config.yaml"):
-        """Initialize the event extractor with configuration."""
-        self.config = self._load_config(config_path)
+    # Fixed extraction instructions, sent as the system prompt; only the user
+    # message (current time and text) varies per call
+    _SYSTEM_PROMPT = """Extract calendar events from the text in the user's message.
+
+Please extract any calendar events mentioned in the text and return them as a JSON array. For each event, include:
+- title: Brief descriptive title
+- description: Full description or context
+- start_time: ISO format datetime (YYYY-MM-DDTHH:MM:SS)
+- end_time: ISO format datetime (YYYY-MM-DDTHH:MM:SS) or null if not specified
+- location: Location if mentioned, or null
+- all_day: true if it's an all-day event, false otherwise
+
+Rules:
+1. If no year is mentioned, assume current year
+2. If no time is mentioned but it's clearly an event, assume it's all-day
+3. If start time is given but no end time, set end_time to null
+4. Be conservative - only extract clear, actionable events
+5. If relative dates are used (e.g., "tomorrow", "next Monday"), calculate the actual date
+6. Return only valid JSON - no additional text or explanations
+7. Description should include important details such as:
+    - Confirmation Codes
+    - Agenda
+    - Instructions for finding the event location
+    - Contact information for event organizers
+    - Relevant URLs such as zoom links or other relevant resources
+8. For flights, consider time zones.
+
+Example output format:
+[
+  {
+    "title": "Meeting with John",
+    "description": "Discuss project proposal",
+    "start_time": "2024-01-15T14:00:00",
+    "end_time": "2024-01-15T15:00:00",
+    "location": "Conference Room A",
+    "all_day": false
+  }
+]
+
+If no events are found, return an empty array: []
+"""
+    _BATCH_PROMPT_INSTRUCTIONS = (
+        "Treat each <docN> block as a separate document. Return a JSON array holding one array of events "
+        "per document, in document order (item i = events extracted from document i), using [] for a "
+        "document with no events. The extraction rules apply to the events of each document.\n"
+    )
+
+    def __init__(self, config_path: str = "config.yaml", config: Optional[Dict[str, Any]] = None):
+        """Initialize the event extractor with configuration, loading it from config_path if not given."""
+        self.config = config if config is not None else load_config(config_path)
+
+        # Resolve settings once rather than walking the config on every call
+        llm_config = self._llm_config = self.config.get('llm', {})
+        self._llm_provider = llm_config.get('provider', 'openai')
+        self._openai_model = llm_config.get('openai_model', 'gpt-4')
+        self._anthropic_model = llm_config.get('anthropic_model', 'claude-3-sonnet-20240229')
+        self._llm_temperature = llm_config.get('temperature', 0.1)
+        self._llm_max_tokens = llm_config.get('max_tokens', 1000)
+        text_config = self.config.get('text', {})
+        self._text_min_length = text_config.get('min_length', 10)
+        self._text_max_length = text_config.get('max_length', 5000)
+        self._default_duration = self.config.get('calendar', {}).get('default_duration', 60)
+        advanced_config = self.config.get('advanced', {})
+        self._request_timeout = advanced_config.get('request_timeout', 30)
+        self._max_retries = advanced_config.get('max_retries', 3)
+
         self._setup_logging()
         self._setup_llm_client()
 
-    def _load_config(self, config_path: str) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
-        try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
-        except FileNotFoundError:
-            logging.warning(f"Config file {config_path} not found. Using defaults.")
-            return self._get_default_config()
-        except yaml.YAMLError as e:
-            logging.error(f"Error parsing config file: {e}")
-            return self._get_default_config()
-
-    def _get_default_config(self) -> Dict[str, Any]:
-        """Get default configuration."""
-        return {
-            'llm': {
-                'provider': 'openai',
-                'openai_model': 'gpt-4',
-                'anthropic_model': 'claude-3-sonnet-20240229',
-                'temperature': 0.1,
-                'max_tokens': 1000
-            },
-            'calendar': {
-                'default_duration': 60,
-                'default_reminder': 15
-            },
-            'text': {
-                'min_length': 10,
-                'max_length': 5000
-            },
-            'logging': {
-                'level': 'INFO'
-            }
-        }
-
     def _setup_logging(self):
         """Setup logging configuration."""
         level = getattr(logging, self.config.get('logging', {}).get('level', 'INFO'))
@@ -84,21 +182,31 @@ class EventExtractor:
 
     def _setup_llm_client(self):
         """Setup LLM client based on configuration."""
-        provider = self.config.get('llm', {}).get('provider', 'openai')
+        provider = self._llm_provider
+        sdk = _import_llm_sdk(provider) if provider in ('openai', 'anthropic') else None
 
-        if provider == 'openai' and openai:
-            api_key = self.config.get('llm', {}).get('openai_api_key')
+        if provider == 'openai' and sdk:
+            api_key = self._llm_config.get('openai_api_key')
             if api_key and api_key != 'your-openai-api-key-here':
-                openai.api_key = api_key
-                self.llm_client = openai
+                self.llm_client = sdk.OpenAI(
+                    api_key=api_key,
+                    timeout=self._request_timeout,
+                    max_retries=self._max_retries,
+                    http_client=self._create_http_client()
+                )
                 self.logger.info("Initialized OpenAI client")
             else:
                 self.logger.warning("OpenAI API key not configured")
                 self.llm_client = None
-        elif provider == 'anthropic' and anthropic:
-            api_key = self.config.get('llm', {}).get('anthropic_api_key')
+        elif provider == 'anthropic' and sdk:
+            api_key = self._llm_config.get('anthropic_api_key')
             if api_key and api_key != 'your-anthropic-api-key-here':
-                self.llm_client = anthropic.Anthropic(api_key=api_key)
+                self.llm_client = sdk.Anthropic(
+                    api_key=api_key,
+                    timeout=self._request_timeout,
+                    max_retries=self._max_retries,
+                    http_client=self._create_http_client()
+                )
                 self.logger.info("Initialized Anthropic client")
             else:
                 self.logger.warning("Anthropic API key not configured")
@@ -107,6 +215,16 @@ class EventExtractor:
             self.logger.warning(f"Unsupported LLM provider: {provider}")
             self.llm_client = None
 
+    def _create_http_client(self):
+        """Create the keep-alive HTTP connection pool shared by every LLM request."""
+        # httpx is installed with both SDKs; one pool lets the test call, batched
+        # requests and fallback worker threads reuse the same TLS connections
+        import httpx
+        return httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=_MAX_EXTRACTION_WORKERS),
+            timeout=self._request_timeout
+        )
+
     def extract_events(self, text: str) -> List[Dict[str, Any]]:
         """Extract events from text using LLM."""
         if not self._validate_text(text):
@@ -116,6 +234,10 @@ class EventExtractor:
             self.logger.error("No LLM client available")
             return []
 
+        return self._extract_validated_events(text)
+
+    def _extract_validated_events(self, text: str) -> List[Dict[str, Any]]:
+        """Extract events from text that has already been validated."""
         try:
             prompt = self._create_extraction_prompt(text)
             response = self._call_llm(prompt)
@@ -125,78 +247,105 @@ class EventExtractor:
             self.logger.error(f"Error extracting events: {e}")
             return []
 
+    def extract_events_stream(self, text: str) -> Iterator[Dict[str, Any]]:
+        """Extract events from text using LLM, yielding each event as soon as the LLM has written it."""
+        if not self._validate_text(text):
+            return
+
+        if not self.llm_client:
+            self.logger.error("No LLM client available")
+            return
+
+        try:
+            # Relative dates resolve against the current time; see _process_events
+            _parse_dt_cached.cache_clear()
+            prompt = self._create_extraction_prompt(text)
+            for event in self._iter_json_array_items(self._stream_llm(prompt)):
+                try:
+                    processed_event = self._process_single_event(event)
+                except Exception as e:
+                    self.logger.error(f"Error processing event {event}: {e}")
+                    continue
+                if processed_event:
+                    yield processed_event
+        except Exception as e:
+            self.logger.error(f"Error extracting events: {e}")
+
+    def extract_events_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """Extract events from several texts with a single LLM call, returning one list per text."""
+        results = [[] for _ in texts]
+        valid = [index for index, text in enumerate(texts) if self._validate_text(text)]
+        if not valid:
+            return results
+
+        if not self.llm_client:
+            self.logger.error("No LLM client available")
+            return results
+
+        if len(valid) == 1:
+            results[valid[0]] = self._extract_validated_events(texts[valid[0]])
+            return results
+
+        valid_texts = [texts[index] for index in valid]
+        try:
+            prompt = self._create_batch_extraction_prompt(valid_texts)
+            response = self._call_llm(prompt)
+            event_lists = self._parse_llm_response(response)
+            if len(event_lists) == len(valid) and all(isinstance(events, list) for events in event_lists):
+                for index, events in zip(valid, event_lists):
+                    results[index] = self._process_events(events)
+                return results
+            self.logger.warning("Batched LLM response did not match the documents sent")
+        except Exception as e:
+            self.logger.warning(f"Error extracting events in a batch: {e}")
+
+        # Fall back to one request per text, issued concurrently
+        self.logger.info(f"Extracting events from {len(valid)} texts individually")
+        with ThreadPoolExecutor(max_workers=min(len(valid), _MAX_EXTRACTION_WORKERS)) as pool:
+            for index, events in zip(valid, pool.map(self._extract_validated_events, valid_texts)):
+                results[index] = events
+        return results
+
     def _validate_text(self, text: str) -> bool:
         """Validate input text."""
-        if not text or not text.strip():
+        if not text:
             self.logger.warning("Empty text provided")
             return False
 
-        text_config = self.config.get('text', {})
-        min_length = text_config.get('min_length', 10)
-        max_length = text_config.get('max_length', 5000)
+        # Check the bounds first so rejected input is never copied by strip()
+        length = len(text)
+
+        if length < self._text_min_length:
+            self.logger.warning(f"Text too short: {length} < {self._text_min_length}")
+            return False
 
-        if len(text) < min_length:
-            self.logger.warning(f"Text too short: {len(text)} < {min_length}")
+        if length > self._text_max_length:
+            self.logger.warning(f"Text too long: {length} > {self._text_max_length}")
             return False
 
-        if len(text) > max_length:
-            self.logger.warning(f"Text too long: {len(text)} > {max_length}")
+        if not text.strip():
+            self.logger.warning("Empty text provided")
             return False
 
         return True
 
     def _create_extraction_prompt(self, text: str) -> str:
-        """Create prompt for LLM to extract events."""
+        """Create the user prompt for LLM to extract events."""
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
+        return f"Current date/time: {current_time}\n\nText to analyze:\n{text}\n"
 
-        prompt = f"""
-Extract calendar events from the following text. Current date/time: {current_time}
-
-Text to analyze:
-{text}
-
-Please extract any calendar events mentioned in the text and return them as a JSON array. For each event, include:
-- title: Brief descriptive title
-- description: Full description or context
-- start_time: ISO format datetime (YYYY-MM-DDTHH:MM:SS)
-- end_time: ISO format datetime (YYYY-MM-DDTHH:MM:SS) or null if not specified
-- location: Location if mentioned, or null
-- all_day: true if it's an all-day event, false otherwise
-
-Rules:
-1. If no year is mentioned, assume current year
-2. If no time is mentioned but it's clearly an event, assume it's all-day
-3. If start time is given but no end time, set end_time to null
-4. Be conservative - only extract clear, actionable events
-5. If relative dates are used (e.g., "tomorrow", "next Monday"), calculate the actual date
-6. Return only valid JSON - no additional text or explanations
-7. Description should include important details such as:
-    - Confirmation Codes
-    - Agenda
-    - Instructions for finding the event location
-    - Contact information for event organizers
-    - Relevant URLs such as zoom links or other relevant resources
-8. For flights, consider time zones.
-
-Example output format:
-[
-  {{
-    "title": "Meeting with John",
-    "description": "Discuss project proposal",
-    "start_time": "2024-01-15T14:00:00",
-    "end_time": "2024-01-15T15:00:00",
-    "location": "Conference Room A",
-    "all_day": false
-  }}
-]
-
-If no events are found, return an empty array: []
-"""
-        return prompt
+    def _create_batch_extraction_prompt(self, texts: List[str]) -> str:
+        """Create prompt for LLM to extract events from several documents at once."""
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
+        documents = "".join(f"<doc{i}>\n{text}\n</doc{i}>\n" for i, text in enumerate(texts))
+        return (
+            f"Current date/time: {current_time}\n\nText to analyze ({len(texts)} documents):\n{documents}\n"
+            f"{self._BATCH_PROMPT_INSTRUCTIONS}"
+        )
 
     def _call_llm(self, prompt: str) -> str:
         """Call the configured LLM with the prompt."""
-        provider = self.config.get('llm', {}).get('provider', 'openai')
+        provider = self._llm_provider
 
         if provider == 'openai':
             return self._call_openai(prompt)
@@ -207,58 +356,124 @@ If no events are found, return an empty array: []
 
     def _call_openai(self, prompt: str) -> str:
         """Call OpenAI API."""
-        model = self.config.get('llm', {}).get('openai_model', 'gpt-4')
-        temperature = self.config.get('llm', {}).get('temperature', 0.1)
-        max_tokens = self.config.get('llm', {}).get('max_tokens', 1000)
-
-        response = openai.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
+        response = self.llm_client.chat.completions.create(**self._openai_request(prompt))
 
         return response.choices[0].message.content
 
     def _call_anthropic(self, prompt: str) -> str:
         """Call Anthropic API."""
-        model = self.config.get('llm', {}).get('anthropic_model', 'claude-3-sonnet-20240229')
-        max_tokens = self.config.get('llm', {}).get('max_tokens', 1000)
-
-        response = self.llm_client.messages.create(
-            model=model,
-            max_tokens=max_tokens,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        response = self.llm_client.messages.create(**self._anthropic_request(prompt))
 
         return response.content[0].text
 
+    def _openai_request(self, prompt: str) -> Dict[str, Any]:
+        """Get the OpenAI chat completion arguments for a prompt."""
+        return {
+            'model': self._openai_model,
+            'messages': [
+                {"role": "system", "content": self._SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            'temperature': self._llm_temperature,
+            'max_tokens': self._llm_max_tokens
+        }
+
+    def _anthropic_request(self, prompt: str) -> Dict[str, Any]:
+        """Get the Anthropic messages arguments for a prompt."""
+        return {
+            'model': self._anthropic_model,
+            'max_tokens': self._llm_max_tokens,
+            'system': self._SYSTEM_PROMPT,
+            'messages': [{"role": "user", "content": prompt}]
+        }
+
+    def _stream_llm(self, prompt: str) -> Iterator[str]:
+        """Call the configured LLM with the prompt, yielding the response text as it arrives."""
+        provider = self._llm_provider
+
+        if provider == 'openai':
+            stream = self.llm_client.chat.completions.create(stream=True, **self._openai_request(prompt))
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        elif provider == 'anthropic':
+            with self.llm_client.messages.stream(**self._anthropic_request(prompt)) as stream:
+                yield from stream.text_stream
+        else:
+            raise ValueError(f"Unsupported LLM provider: {provider}")
+
+    def _iter_json_array_items(self, chunks: Iterable[str]) -> Iterator[Any]:
+        """Decode the objects of the first JSON array in a stream of text chunks as each one completes."""
+        buffer = ''
+        search_from = 0
+        index = None  # where the next item starts, once the array has been found
+        for chunk in chunks:
+            buffer += chunk
+            while True:
+                if index is None:
+                    start = buffer.find('[', search_from)
+                    if start == -1:
+                        search_from = len(buffer)
+                        break
+                    index = start + 1
+
+                # Skip the separators before the next item
+                while index < len(buffer) and buffer[index] in ' \t\r\n,':
+                    index += 1
+                if index == len(buffer):
+                    break
+                if buffer[index] == ']':
+                    return
+                if buffer[index] != '{':
+                    # A bracket in prose rather than the event array
+                    search_from = index
+                    index = None
+                    continue
+
+                try:
+                    item, index = _JSON_DECODER.raw_decode(buffer, index)
+                except json.JSONDecodeError:
+                    # The object is not complete yet
+                    break
+                yield item
+
+        if index is None:
+            self.logger.warning("No JSON array found in the LLM response")
+        else:
+            self.logger.warning("LLM response ended before the JSON array was complete")
+        self.logger.debug(f"Response was: {buffer}")
+
     def _parse_llm_response(self, response: str) -> List[Dict[str, Any]]:
         """Parse LLM response to extract events."""
+        # The prompt asks for bare JSON, so try the whole response first
         try:
-            # Try to find JSON in the response
-            json_match = re.search(r'\[.*\]', response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
-                events = json.loads(json_str)
-                if isinstance(events, list):
-                    return events
-
-            # If no JSON array found, try parsing the entire response
-            events = json.loads(response)
+            events = _json_loads(response)
             if isinstance(events, list):
                 return events
+        except ValueError:
+            pass
 
-            self.logger.warning("LLM response is not a valid JSON array")
-            return []
+        # Otherwise decode from each '[' in turn and stop at the first complete
+        # array, ignoring any prose before or after it
+        index = response.find('[')
+        while index != -1:
+            try:
+                events, _ = _JSON_DECODER.raw_decode(response, index)
+                if isinstance(events, list):
+                    return events
+            except json.JSONDecodeError:
+                pass
+            index = response.find('[', index + 1)
 
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Failed to parse LLM response as JSON: {e}")
-            self.logger.debug(f"Response was: {response}")
-            return []
+        self.logger.error("Failed to find a JSON array in the LLM response")
+        self.logger.debug(f"Response was: {response}")
+        return []
 
     def _process_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process and validate extracted events."""
+        # Relative phrases ("tomorrow", "next Monday") resolve against the
+        # current time, so parses are only reused within one extraction
+        _parse_dt_cached.cache_clear()
         processed_events = []
 
         for event in events:
@@ -292,8 +507,7 @@ If no events are found, return an empty array: []
 
         # If no end time specified, use default duration
         if not end_time and not event.get('all_day', False):
-            duration = self.config.get('calendar', {}).get('default_duration', 60)
-            end_time = start_time + timedelta(minutes=duration)
+            end_time = start_time + timedelta(minutes=self._default_duration)
 
         return {
             'title': event['title'].strip(),
@@ -310,21 +524,7 @@ If no events are found, return an empty array: []
             return None
 
         try:
-            # Try ISO format first
-            if 'T' in dt_str:
-                return datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-
-            # Use dateparser for flexible parsing
-            parsed = dateparser.parse(dt_str)
-            if parsed:
-                # If no timezone info, assume local timezone
-                if parsed.tzinfo is None:
-                    local_tz = tz.tzlocal()
-                    parsed = parsed.replace(tzinfo=local_tz)
-                return parsed
-
-            return None
-
+            return _parse_dt_cached(dt_str)
         except Exception as e:
             self.logger.error(f"Error parsing datetime '{dt_str}': {e}")
             return None
@@ -160,6 +160,9 @@ sys.path.insert(0, '$SCRIPT_DIR')
 try:
     from event_extractor import EventExtractor
     from calendar_manager import CalendarManager
+    # The LLM SDKs are only imported when a client is created, so check them here
+    import openai
+    import anthropic
     print('Python modules imported successfully')
 except ImportError as e:
     print(f'Import error: {e}')
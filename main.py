@@ -6,17 +6,33 @@ Extract calendar events from text using LLM and add them to macOS Calendar
 
 import sys
 import os
-import argparse
+import json
 import logging
+from functools import cached_property
 from pathlib import Path
-from typing import List, Dict, Any
+from types import SimpleNamespace
+from typing import List, Dict, Any, Optional, Iterator
 import subprocess
+import hashlib
+import queue
+import threading
 
-# Add current directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from event_extractor import EventExtractor, load_config
 
-from event_extractor import EventExtractor
-from calendar_manager import CalendarManager
+# Queued by the extraction thread after the last event
+_EXTRACTION_DONE = object()
+
+# Escapes text for use inside a double-quoted AppleScript string
+_APPLESCRIPT_QUOTE_TABLE = str.maketrans({'"': '\\"', '\\': '\\\\'})
+
+# Notification AppleScript taking the title and message as arguments, compiled
+# once with osacompile so later notifications skip parsing the source
+_NOTIFY_SCRIPT_SOURCE = '''on run argv
+    tell application "System Events" to display notification (item 2 of argv) with title (item 1 of argv)
+end run'''
+# Named by a hash of the source, so changing the script compiles a new copy
+_NOTIFY_SCRIPT_PATH = (Path.home() / 'Library' / 'Caches' / 'event-extractor' /
+                       f"notify-{hashlib.sha1(_NOTIFY_SCRIPT_SOURCE.encode('utf-8')).hexdigest()[:12]}.scpt")
 
 
 class EventExtractorApp:
@@ -27,10 +43,27 @@ class EventExtractorApp:
         if config_path is None:
             config_path = os.path.join(os.path.dirname(__file__), 'config.yaml')
 
-        self.extractor = EventExtractor(config_path)
-        self.calendar_manager = CalendarManager(self.extractor.config)
+        self.config = load_config(config_path)
         self.logger = logging.getLogger(__name__)
 
+        # Resolve settings once rather than walking the config on every call
+        service_config = self.config.get('service', {})
+        self._confirm = service_config.get('confirm_before_adding', True)
+        self._notify = service_config.get('show_notifications', True)
+        # Longer texts are rejected by the extractor, so never read past this
+        self._max_text_length = self.config.get('text', {}).get('max_length', 5000)
+
+    @cached_property
+    def extractor(self):
+        """Get the event extractor, creating it and its LLM client on first use."""
+        return EventExtractor(config=self.config)
+
+    @cached_property
+    def calendar_manager(self):
+        """Get the calendar manager, loading EventKit on first use."""
+        from calendar_manager import CalendarManager
+        return CalendarManager(self.config)
+
     def run_from_clipboard(self) -> int:
         """Extract events from clipboard text and add to calendar."""
         try:
@@ -41,7 +74,7 @@ class EventExtractorApp:
                 return 1
 
             print(f"Processing text from clipboard ({len(text)} characters)...")
-            return self._process_text(text)
+            return self._process_text([text])
 
         except Exception as e:
             self.logger.error(f"Error processing clipboard: {e}")
@@ -52,7 +85,7 @@ class EventExtractorApp:
         """Extract events from provided text and add to calendar."""
         try:
             print(f"Processing provided text ({len(text)} characters)...")
-            return self._process_text(text)
+            return self._process_text([text])
 
         except Exception as e:
             self.logger.error(f"Error processing text: {e}")
@@ -62,11 +95,12 @@ class EventExtractorApp:
     def run_from_file(self, file_path: str) -> int:
         """Extract events from file and add to calendar."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
+            text = self._read_text_file(file_path)
+            if text is None:
+                return 1
 
             print(f"Processing text from file: {file_path} ({len(text)} characters)...")
-            return self._process_text(text)
+            return self._process_text([text])
 
         except FileNotFoundError:
             print(f"Error: File not found: {file_path}")
@@ -76,37 +110,99 @@ class EventExtractorApp:
             print(f"Error: {e}")
             return 1
 
-    def _process_text(self, text: str) -> int:
-        """Process text and extract events."""
-        # Check calendar access first
+    def run_from_files(self, file_paths: List[str]) -> int:
+        """Extract events from several files in one batch and add to calendar."""
+        texts = []
+        for file_path in file_paths:
+            try:
+                text = self._read_text_file(file_path)
+                if text is None:
+                    return 1
+            except FileNotFoundError:
+                print(f"Error: File not found: {file_path}")
+                return 1
+            except Exception as e:
+                self.logger.error(f"Error reading file {file_path}: {e}")
+                print(f"Error: {e}")
+                return 1
+
+            print(f"Read text from file: {file_path} ({len(text)} characters)")
+            texts.append(text)
+
+        try:
+            print(f"Processing {len(texts)} files...")
+            return self._process_text(texts)
+
+        except Exception as e:
+            self.logger.error(f"Error processing files: {e}")
+            print(f"Error: {e}")
+            return 1
+
+    def _read_text_file(self, file_path: str) -> Optional[str]:
+        """Read a text file, or return None if it is longer than the extractor accepts."""
+        # Read one character past the limit, so an oversized file is
+        # detected without loading all of it
+        with open(file_path, 'r', encoding='utf-8') as f:
+            text = f.read(self._max_text_length + 1)
+
+        if len(text) > self._max_text_length:
+            print(f"Error: File too large: {file_path} (more than {self._max_text_length} characters)")
+            return None
+        return text
+
+    def run_from_texts_json(self, json_path: str) -> int:
+        """Extract events from a JSON array of texts in one batch and add to calendar."""
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                texts = json.load(f)
+
+            if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                print(f"Error: {json_path} must contain a JSON array of strings")
+                return 1
+            if not texts:
+                print(f"No texts found in {json_path}")
+                return 1
+
+            print(f"Processing {len(texts)} texts from {json_path}...")
+            return self._process_text(texts)
+
+        except FileNotFoundError:
+            print(f"Error: File not found: {json_path}")
+            return 1
+        except Exception as e:
+            self.logger.error(f"Error processing texts from {json_path}: {e}")
+            print(f"Error: {e}")
+            return 1
+
+    def _process_text(self, texts: List[str]) -> int:
+        """Process one or more texts and extract events."""
+        # Extract events using LLM, in the background so the request is
+        # already in flight while the calendar access prompt waits on the user
+        print("Extracting events using LLM...")
+        extraction = self._start_extraction(texts)
+
+        # Check calendar access
         if not self.calendar_manager.request_calendar_access():
             print("Error: Calendar access is required but not granted.")
             print("Please grant calendar access in System Preferences > Security & Privacy > Privacy > Calendars")
             return 1
 
-        # Extract events using LLM
-        print("Extracting events using LLM...")
-        events = self.extractor.extract_events(text)
+        # List each event as soon as the LLM has written it
+        events = []
+        for event in self._iter_extracted_events(extraction):
+            if not events:
+                self._write("Events found:\n")
+            events.append(event)
+            self._write(self._format_events([event], start=len(events)))
 
         if not events:
             print("No events found in the text.")
             return 0
 
-        print(f"Found {len(events)} event(s):")
-        for i, event in enumerate(events, 1):
-            print(f"{i}. {event['title']}")
-            if event.get('start_time'):
-                start_str = event['start_time'].strftime("%Y-%m-%d %H:%M")
-                print(f"   Start: {start_str}")
-            if event.get('end_time'):
-                end_str = event['end_time'].strftime("%Y-%m-%d %H:%M")
-                print(f"   End: {end_str}")
-            if event.get('location'):
-                print(f"   Location: {event['location']}")
-            print()
+        print(f"Found {len(events)} event(s).")
 
         # Confirm before adding to calendar
-        if self.extractor.config.get('service', {}).get('confirm_before_adding', True):
+        if self._confirm:
             response = input("Add these events to calendar? (y/N): ").strip().lower()
             if response not in ['y', 'yes']:
                 print("Cancelled.")
@@ -117,25 +213,99 @@ class EventExtractorApp:
         results = self.calendar_manager.add_events(events)
 
         success_count = 0
+        lines = []
         for i, result in enumerate(results):
             event_title = events[i]['title']
             if result['success']:
                 success_count += 1
-                print(f"✓ Added: {event_title}")
+                lines.append(f"✓ Added: {event_title}\n")
+            elif result.get('duplicate'):
+                lines.append(f"- Skipped: {event_title} (already in calendar)\n")
             else:
-                print(f"✗ Failed to add: {event_title} - {result.get('error', 'Unknown error')}")
+                lines.append(f"✗ Failed to add: {event_title} - {result.get('error', 'Unknown error')}\n")
 
-        print(f"\nSuccessfully added {success_count} of {len(events)} events to calendar.")
+        lines.append(f"\nSuccessfully added {success_count} of {len(events)} events to calendar.\n")
+        self._write("".join(lines))
 
         # Show notification if configured
-        if (success_count > 0 and
-            self.extractor.config.get('service', {}).get('show_notifications', True)):
+        if success_count > 0 and self._notify:
             self._show_notification(f"Added {success_count} event(s) to calendar")
 
         return 0 if success_count > 0 else 1
 
+    def _start_extraction(self, texts: List[str]) -> queue.Queue:
+        """Start extracting events from texts on a background thread, queueing each event as it is parsed."""
+        extraction = queue.Queue()
+
+        def extract():
+            try:
+                if len(texts) == 1:
+                    # Streamed, so events are queued while the LLM is still writing
+                    for event in self.extractor.extract_events_stream(texts[0]):
+                        extraction.put(event)
+                else:
+                    # One LLM request covers every text
+                    for event_list in self.extractor.extract_events_batch(texts):
+                        for event in event_list:
+                            extraction.put(event)
+                extraction.put(_EXTRACTION_DONE)
+            except BaseException as e:
+                extraction.put(e)
+
+        # A daemon thread, so a denied access check can exit without waiting
+        # for the LLM response
+        threading.Thread(target=extract, daemon=True).start()
+        return extraction
+
+    def _iter_extracted_events(self, extraction: queue.Queue) -> Iterator[Dict[str, Any]]:
+        """Yield queued events until the extraction finishes, re-raising any error it hit."""
+        while True:
+            item = extraction.get()
+            if item is _EXTRACTION_DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def _format_events(self, events: List[Dict[str, Any]], detailed: bool = False, start: int = 1) -> str:
+        """Format extracted events as a numbered listing; detailed adds full timestamps and descriptions."""
+        lines = []
+        append = lines.append
+        for i, event in enumerate(events, start):
+            append(f"{i}. {event['title']}")
+            start_time = event.get('start_time')
+            if start_time:
+                append(f"   Start: {start_time if detailed else start_time.strftime('%Y-%m-%d %H:%M')}")
+            end_time = event.get('end_time')
+            if end_time:
+                append(f"   End: {end_time if detailed else end_time.strftime('%Y-%m-%d %H:%M')}")
+            if event.get('location'):
+                append(f"   Location: {event['location']}")
+            if detailed and event.get('description'):
+                append(f"   Description: {event['description']}")
+            append("")
+
+        # One join, so the caller can write the listing in one call
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _write(self, output: str):
+        """Write a block of output to stdout in one call."""
+        sys.stdout.write(output)
+        sys.stdout.flush()
+
     def _get_clipboard_text(self) -> str:
         """Get text from macOS clipboard."""
+        # Read the clipboard in-process when PyObjC's AppKit bindings are
+        # available; imported here so other modes never load AppKit
+        try:
+            from AppKit import NSPasteboard, NSPasteboardTypeString
+        except ImportError:
+            NSPasteboard = None
+
+        if NSPasteboard is not None:
+            text = NSPasteboard.generalPasteboard().stringForType_(NSPasteboardTypeString)
+            return str(text) if text else ""
+
         try:
             result = subprocess.run(['pbpaste'], capture_output=True, text=True, check=True)
             return result.stdout
@@ -146,15 +316,47 @@ class EventExtractorApp:
     def _show_notification(self, message: str, title: str = "Event Extractor"):
         """Show macOS notification."""
         try:
-            # Escape quotes in message and title
-            safe_message = message.replace('"', '\\"')
-            safe_title = title.replace('"', '\\"')
+            script_path = self._get_notify_script()
+            if script_path is not None:
+                # Title and message are passed as arguments, so need no escaping
+                try:
+                    subprocess.run(['osascript', str(script_path), title, message], check=True)
+                    return
+                except subprocess.CalledProcessError as e:
+                    # Drop a corrupt cached script so the next run recompiles it
+                    self.logger.debug(f"Compiled notification script failed: {e}")
+                    try:
+                        script_path.unlink()
+                    except OSError:
+                        pass
+
+            # Escape backslashes and quotes for AppleScript string literals
+            safe_message = message.translate(_APPLESCRIPT_QUOTE_TABLE)
+            safe_title = title.translate(_APPLESCRIPT_QUOTE_TABLE)
 
             script = f'tell application "System Events" to display notification "{safe_message}" with title "{safe_title}"'
             subprocess.run(['osascript', '-e', script], check=True)
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Error showing notification: {e}")
 
+    def _get_notify_script(self) -> Optional[Path]:
+        """Get the compiled notification script, compiling it on first use; None if that fails."""
+        if _NOTIFY_SCRIPT_PATH.exists():
+            return _NOTIFY_SCRIPT_PATH
+
+        try:
+            _NOTIFY_SCRIPT_PATH.parent.mkdir(parents=True, exist_ok=True)
+            # Compile beside the final path and move it into place, so a
+            # concurrent run never sees a partly written script
+            temp_path = _NOTIFY_SCRIPT_PATH.with_name(f"{_NOTIFY_SCRIPT_PATH.stem}.{os.getpid()}.scpt")
+            subprocess.run(['osacompile', '-o', str(temp_path), '-e', _NOTIFY_SCRIPT_SOURCE],
+                           check=True, capture_output=True)
+            os.replace(temp_path, _NOTIFY_SCRIPT_PATH)
+            return _NOTIFY_SCRIPT_PATH
+        except (OSError, subprocess.CalledProcessError) as e:
+            self.logger.debug(f"Could not compile notification script: {e}")
+            return None
+
     def list_calendars(self) -> int:
         """List available calendars."""
         if not self.calendar_manager.request_calendar_access():
@@ -194,24 +396,61 @@ class EventExtractorApp:
             print("No events extracted. Check your LLM configuration.")
             return 1
 
-        print(f"Successfully extracted {len(events)} event(s):")
-        for i, event in enumerate(events, 1):
-            print(f"{i}. {event['title']}")
-            if event.get('start_time'):
-                print(f"   Start: {event['start_time']}")
-            if event.get('end_time'):
-                print(f"   End: {event['end_time']}")
-            if event.get('location'):
-                print(f"   Location: {event['location']}")
-            if event.get('description'):
-                print(f"   Description: {event['description']}")
-            print()
+        self._write(f"Successfully extracted {len(events)} event(s):\n{self._format_events(events, detailed=True)}")
 
         return 0
 
 
-def main():
-    """Main entry point."""
+# Options taking a single value, and flags, mapped to their argument names
+_VALUE_OPTIONS = {
+    '-t': 'text', '--text': 'text',
+    '-c': 'config', '--config': 'config',
+    '--texts-json': 'texts_json',
+    '--test-text': 'test_text',
+}
+_FLAG_OPTIONS = {
+    '--list-calendars': 'list_calendars',
+    '--test-llm': 'test_llm',
+    '-v': 'verbose', '--verbose': 'verbose',
+}
+
+
+def _parse_args_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse the common command lines without argparse, or return None to defer to it."""
+    args = SimpleNamespace(text=None, file=None, texts_json=None, config=None,
+                           list_calendars=False, test_llm=False, test_text=None, verbose=False)
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in _FLAG_OPTIONS:
+            setattr(args, _FLAG_OPTIONS[arg], True)
+            i += 1
+        elif arg in _VALUE_OPTIONS:
+            if i + 1 == len(argv) or argv[i + 1].startswith('-'):
+                return None
+            setattr(args, _VALUE_OPTIONS[arg], argv[i + 1])
+            i += 2
+        elif arg in ('-f', '--file'):
+            # Like nargs='+': take every value up to the next option
+            i += 1
+            files = []
+            while i < len(argv) and not argv[i].startswith('-'):
+                files.append(argv[i])
+                i += 1
+            if not files:
+                return None
+            args.file = files
+        else:
+            # --help, --opt=value forms, typos and stray values go to argparse,
+            # which reports them properly
+            return None
+    return args
+
+
+def _build_parser():
+    """Build the full argument parser, used for help and error reporting."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Extract calendar events from text using LLM and add them to macOS Calendar",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -220,6 +459,8 @@ Examples:
   %(prog)s                          # Process text from clipboard
   %(prog)s -t "Meeting tomorrow 2pm" # Process provided text
   %(prog)s -f notes.txt             # Process text from file
+  %(prog)s -f a.txt b.txt           # Process several files in one batch
+  %(prog)s --texts-json texts.json  # Process a JSON array of texts in one batch
   %(prog)s --list-calendars         # List available calendars
   %(prog)s --test-llm               # Test LLM connection
         """
@@ -232,7 +473,13 @@ Examples:
 
     parser.add_argument(
         '-f', '--file',
-        help='File containing text to process'
+        nargs='+',
+        help='File(s) containing text to process; several files are extracted in one batch'
+    )
+
+    parser.add_argument(
+        '--texts-json',
+        help='JSON file holding an array of texts to process in one batch'
     )
 
     parser.add_argument(
@@ -263,7 +510,17 @@ Examples:
         help='Enable verbose logging'
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main entry point."""
+    # Typical invocations are parsed by hand, so argparse is only imported
+    # and built for --help or a command line the fast path doesn't handle
+    argv = sys.argv[1:]
+    args = _parse_args_fast(argv)
+    if args is None:
+        args = _build_parser().parse_args(argv)
 
     # Setup logging
     if args.verbose:
@@ -287,7 +544,11 @@ Examples:
         elif args.text:
             return app.run_from_text(args.text)
         elif args.file:
-            return app.run_from_file(args.file)
+            if len(args.file) == 1:
+                return app.run_from_file(args.file[0])
+            return app.run_from_files(args.file)
+        elif args.texts_json:
+            return app.run_from_texts_json(args.texts_json)
         else:
             # Default: process clipboard
             return app.run_from_clipboard()